@@ -3,34 +3,181 @@
 Edpak Validator - A tool for verifying edpak file compliance
 """
 
+import asyncio
+import functools
+import io
 import json
+import os
+import re
 import zipfile
 import sys
-from collections import defaultdict
-from typing import Tuple, List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Final, Tuple, Type, List, Dict, Any, NamedTuple, Optional
 from pathlib import Path
 
+try:
+    import fastjsonschema  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+# Fastest available JSON decoder: orjson, then msgspec, then stdlib.
+# All three accept the raw manifest bytes; the error type is aliased
+# alongside the loader so the handling code is backend-agnostic. The
+# aliases are declared up front so the branch assignments type-check
+# (and mypyc-compile) against one common shape.
+_loads: Callable[[bytes], Any]
+_JSONDecodeError: Type[Exception]
+try:
+    import orjson
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # pragma: no cover - optional speedup
+    try:
+        import msgspec.json  # type: ignore[import-not-found]
+        _loads = msgspec.json.decode
+        _JSONDecodeError = msgspec.DecodeError
+    except ImportError:
+        _loads = json.loads
+        _JSONDecodeError = json.JSONDecodeError
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+
+# Every exception that means "manifest.json is not valid JSON", whichever
+# decode backend raised it; ijson's parse errors are not _JSONDecodeError.
+if ijson is not None:
+    _MANIFEST_DECODE_ERRORS: Tuple[Type[Exception], ...] = (
+        _JSONDecodeError, ijson.JSONError
+    )
+else:
+    _MANIFEST_DECODE_ERRORS = (_JSONDecodeError,)
+
+# Manifests below this size are decompressed in one go; larger ones are
+# streamed through ijson (when installed) so peak memory stays constant
+# regardless of how many lessons/modules the course defines.
+_STREAM_THRESHOLD = 1024 * 1024
+
+# Captures the top-level directory of a nested archive member in a single
+# C-level scan, without the throwaway list that str.split allocates.
+_ROOT_RE = re.compile(r'^([^/]+)/')
+
+# The only top-level asset directories the standard permits; a module-level
+# frozenset so the membership test never re-allocates the set per call.
+_ALLOWED_TOP_DIRS = frozenset({"images", "videos", "files"})
+
+# Archives below this size are slurped into memory in one read, so the
+# EOCD scan, central-directory parse, and member reads all hit a BytesIO
+# instead of issuing separate seek+read syscalls against the file.
+_PRELOAD_THRESHOLD = 1024 * 1024
+
+# Hard ceilings consulted before any decompression happens, so a
+# zip-bomb-style archive is rejected from central-directory metadata
+# alone instead of being inflated into RAM.
+_MAX_MANIFEST_BYTES = 32 * 1024 * 1024
+_MAX_ENTRIES = 1_000_000
+
+
+# JSON Schema for the edpak manifest, compiled once at import time when
+# fastjsonschema is available.  The compiled validator is code-generated
+# straight-line Python, roughly an order of magnitude faster than the
+# per-field checks — but it raises on the first violation, so it is only
+# used as an accept/reject gate; error text always comes from the
+# per-field checks so messages never depend on installed extras.
+_MANIFEST_SCHEMA = {
+    "type": "object",
+    "required": ["title", "version", "author", "modules"],
+    "properties": {
+        "title": {"type": "string", "minLength": 1},
+        "version": {"type": "string", "minLength": 1},
+        "author": {"type": "string", "minLength": 1},
+        "description": {"type": "string"},
+        "language": {"type": "string"},
+        "modules": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "title"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "title": {"type": "string"},
+                    "content": {"type": "string"},
+                    "order": {"type": "number"},
+                },
+            },
+        },
+    },
+}
+
+if fastjsonschema is not None:
+    _VALIDATE_MANIFEST = fastjsonschema.compile(_MANIFEST_SCHEMA)
+else:
+    _VALIDATE_MANIFEST = None
+
+
+class ValidationResult(NamedTuple):
+    """
+    Outcome of one validation run.
+
+    A NamedTuple subclasses tuple, so existing callers that unpack
+    ``is_valid, errors, warnings = verify_edpak(...)`` keep working at
+    plain-tuple speed, while new code can use the named fields.
+    """
+    is_valid: bool
+    errors: List[str]
+    warnings: List[str]
+
+
+def _has_valid_image(image_lessons, fileset: frozenset) -> bool:
+    """True if any image lesson's filePath names a member of the archive"""
+    for lesson in image_lessons:
+        fp = lesson.get('filePath')
+        if isinstance(fp, str) and fp and fp in fileset:
+            return True
+    return False
+
 
 class EdpakValidator:
     """Validator for edpak files according to the edpak standard v1.0"""
     
-    REQUIRED_MANIFEST_FIELDS = ['title', 'version', 'author', 'modules']
+    REQUIRED_MANIFEST_FIELDS: Final = frozenset({'title', 'version', 'author', 'modules'})
     # Modules require an identity and title; content paths are now optional
-    REQUIRED_MODULE_FIELDS = ['id', 'title']
-    
+    REQUIRED_MODULE_FIELDS: Final = frozenset({'id', 'title'})
+
+    # Fields that, when present, must hold strings — checked in one
+    # data-driven loop rather than a cascade of near-identical branches.
+    _STR_FIELDS: Final = ('title', 'version', 'author', 'description', 'language')
+    _MODULE_STR_FIELDS: Final = ('id', 'title', 'content')
+
+    # Fixed attribute layout: no per-instance __dict__ allocation, and
+    # attribute access resolves through the fast slot descriptors.
+    __slots__ = ('filepath', 'errors', 'warnings', 'manifest',
+                 '_fatal', '_result')
+
     def __init__(self, filepath: str):
         self.filepath = filepath
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.manifest: Optional[Dict[str, Any]] = None
+        # Set when an error is severe enough that deeper structural
+        # checks would be meaningless (missing manifest, missing
+        # required fields, malformed containers).
+        self._fatal = False
+        # Memoized result of validate(); repeat calls on the same
+        # instance reuse it instead of reopening the archive.
+        self._result: Optional[ValidationResult] = None
         
-    def validate(self) -> Tuple[bool, List[str], List[str]]:
+    def validate(self) -> ValidationResult:
         """
         Validate an edpak file for compliance with the edpak standard.
         
         Returns:
-            Tuple of (is_valid, errors, warnings)
+            ValidationResult of (is_valid, errors, warnings)
         """
+        if self._result is not None:
+            return self._result
+
         # Check file extension
         if not self.filepath.endswith('.edpak'):
             self.errors.append("File must have .edpak extension")
@@ -38,155 +185,232 @@ class EdpakValidator:
         # Check if file exists
         if not Path(self.filepath).exists():
             self.errors.append(f"File not found: {self.filepath}")
-            return False, self.errors, self.warnings
-            
-        # Check if it's a valid ZIP file
-        if not zipfile.is_zipfile(self.filepath):
-            self.errors.append("File is not a valid ZIP archive")
-            return False, self.errors, self.warnings
+            self._result = ValidationResult(False, self.errors, self.warnings)
+            return self._result
             
-        # Open and inspect the ZIP file
+        # Open and inspect the ZIP file. ZipFile itself scans for the
+        # end-of-central-directory record, so a separate is_zipfile()
+        # pre-check would just repeat that open+seek. Small archives are
+        # preloaded whole so that scan and the member reads stay in memory.
         try:
-            with zipfile.ZipFile(self.filepath, 'r') as zf:
+            source: Any = self.filepath
+            if os.path.getsize(self.filepath) < _PRELOAD_THRESHOLD:
+                with open(self.filepath, 'rb') as fh:
+                    source = io.BytesIO(fh.read())
+            with zipfile.ZipFile(source, 'r') as zf:
                 self._validate_zip_contents(zf)
+        except zipfile.BadZipFile:
+            self.errors.append("File is not a valid ZIP archive")
+            self._result = ValidationResult(False, self.errors, self.warnings)
+            return self._result
         except Exception as e:
             self.errors.append(f"Error reading ZIP file: {str(e)}")
             
         is_valid = len(self.errors) == 0
-        return is_valid, self.errors, self.warnings
+        self._result = ValidationResult(is_valid, self.errors, self.warnings)
+        return self._result
         
     def _validate_zip_contents(self, zf: zipfile.ZipFile) -> None:
         """Validate the contents of the ZIP archive"""
-        filelist = zf.namelist()
+        # Materialize the (already cached) central directory once as a
+        # frozenset so every downstream membership test is a hashed lookup
+        # instead of an O(N) list scan.
+        names = zf.namelist()
+        if len(names) > _MAX_ENTRIES:
+            self._fatal = True
+            self.errors.append(
+                f"Archive contains too many entries ({len(names)}, maximum is {_MAX_ENTRIES})"
+            )
+            return
+
+        fileset = frozenset(names)
+        root_dirs = {m.group(1) for m in map(_ROOT_RE.match, fileset) if m}
 
         # Enforce that only well-known asset directories are present.
         # Producers should not include arbitrary top-level directories
         # like "modules/" or "assets/" – all structured content lives
         # in manifest.json and raw assets under images/videos/files.
-        self._validate_directories(filelist)
-        
+        self._validate_directories(root_dirs)
+
         # Check for manifest.json
-        if 'manifest.json' not in filelist:
+        if 'manifest.json' not in fileset:
+            self._fatal = True
             self.errors.append("Missing required manifest.json file in root directory")
             return
-            
+
+        # Refuse to decompress an absurdly large manifest; the size is
+        # available from central-directory metadata for free.
+        manifest_info = zf.getinfo('manifest.json')
+        if manifest_info.file_size > _MAX_MANIFEST_BYTES:
+            self._fatal = True
+            self.errors.append(
+                f"manifest.json is too large ({manifest_info.file_size} bytes, "
+                f"maximum is {_MAX_MANIFEST_BYTES})"
+            )
+            return
+
         # Read and validate manifest
         try:
-            manifest_data = zf.read('manifest.json')
-            manifest = json.loads(manifest_data)
+            manifest = self._read_manifest(zf, manifest_info)
             # Store manifest for optional introspection by callers / CLI
             self.manifest = manifest
-        except json.JSONDecodeError as e:
+        except _MANIFEST_DECODE_ERRORS as e:
+            self._fatal = True
             self.errors.append(f"Invalid JSON in manifest.json: {str(e)}")
             return
         except Exception as e:
+            self._fatal = True
             self.errors.append(f"Error reading manifest.json: {str(e)}")
             return
             
-        self._validate_manifest(manifest, filelist)
-        
-    def _validate_manifest(self, manifest: dict, filelist: List[str]) -> None:
+        self._validate_manifest(manifest, fileset)
+
+    def _read_manifest(self, zf: zipfile.ZipFile,
+                       info: zipfile.ZipInfo) -> Any:
+        """
+        Parse manifest.json from the archive.
+
+        Small manifests take the fast in-memory path; manifests over
+        _STREAM_THRESHOLD are streamed through ijson (when installed) via
+        zf.open so the raw bytes are never buffered whole. The caller
+        passes the already-fetched ZipInfo so the central directory is
+        only consulted once. Like the decoders, this returns whatever
+        the document's root value is; _validate_manifest rejects
+        non-object roots with the canonical message.
+        """
+        with zf.open(info) as stream:
+            if ijson is not None and info.file_size >= _STREAM_THRESHOLD:
+                # items('') yields the root value whatever its type, so a
+                # non-object root is surfaced as-is instead of kvitems
+                # silently flattening it into an empty dict. use_float
+                # keeps JSON numbers as float (ijson defaults to Decimal,
+                # which the 'order' checks would wrongly reject).
+                return next(ijson.items(stream, '', use_float=True), None)
+            # Small manifests: one read of the member, decoded directly
+            # from the bytes object (orjson/msgspec are zero-copy here).
+            return _loads(stream.read())
+
+    def _validate_manifest(self, manifest: dict, fileset: frozenset) -> None:
         """Validate the manifest structure and content"""
-        # Check required fields
-        for field in self.REQUIRED_MANIFEST_FIELDS:
-            if field not in manifest:
-                self.errors.append(f"Missing required field in manifest: {field}")
-            elif field != 'modules' and not manifest[field]:
-                # Allow empty modules array, but not empty strings
-                self.errors.append(f"Required field '{field}' cannot be empty")
-                
-        # Validate field types
-        if 'title' in manifest and not isinstance(manifest['title'], str):
-            self.errors.append("Field 'title' must be a string")
-            
-        if 'version' in manifest and not isinstance(manifest['version'], str):
-            self.errors.append("Field 'version' must be a string")
-            
-        if 'author' in manifest and not isinstance(manifest['author'], str):
-            self.errors.append("Field 'author' must be a string")
-            
-        if 'description' in manifest and not isinstance(manifest['description'], str):
-            self.errors.append("Field 'description' must be a string")
-            
-        if 'language' in manifest and not isinstance(manifest['language'], str):
-            self.errors.append("Field 'language' must be a string")
-            
-        if 'modules' in manifest:
-            if not isinstance(manifest['modules'], list):
-                self.errors.append("Field 'modules' must be an array")
-            else:
-                if len(manifest['modules']) == 0:
-                    self.warnings.append("No modules defined in manifest")
-                self._validate_modules(manifest['modules'], filelist)
-                
+        if not isinstance(manifest, dict):
+            self._fatal = True
+            self.errors.append("manifest.json must contain a JSON object")
+            return
+
+        # .difference keeps the result a frozenset; the '-' operator on a
+        # dict keys view would bounce through __rsub__ and build a set.
+        if self.REQUIRED_MANIFEST_FIELDS.difference(manifest.keys()):
+            self._fatal = True
+
+        # Fast pre-filter: the schema validator compiled at import time
+        # accepts well-formed manifests in one straight-line pass. It is
+        # only ever used as a boolean gate — it raises on the *first*
+        # violation, so the per-field checks below remain the sole source
+        # of error messages and still accumulate every problem at once.
+        schema_ok = False
+        if _VALIDATE_MANIFEST is not None:
+            try:
+                _VALIDATE_MANIFEST(manifest)
+                schema_ok = True
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+
+        if schema_ok:
+            # The schema guarantees required fields, types, and non-empty
+            # strings; only the cross-reference checks it cannot express
+            # remain (ID uniqueness, content paths in the archive).
+            modules = manifest['modules']
+            if len(modules) == 0:
+                self.warnings.append("No modules defined in manifest")
+            self._validate_module_references(modules, fileset)
+        else:
+            self._validate_manifest_fields(manifest)
+            if 'modules' in manifest:
+                modules = manifest['modules']
+                if not isinstance(modules, list):
+                    self._fatal = True
+                    self.errors.append("Field 'modules' must be an array")
+                else:
+                    if len(modules) == 0:
+                        self.warnings.append("No modules defined in manifest")
+                    self._validate_modules(modules, fileset)
+
         # Perform additional semantic validation when extended fields
-        # like lessons/files are present (Leyline exports, etc.).
-        self._validate_course_structure(manifest, filelist)
+        # like lessons/files are present (Leyline exports, etc.) —
+        # unless a fatal structural error already makes it meaningless.
+        if not self._fatal:
+            self._validate_course_structure(manifest, fileset)
+
+    def _validate_manifest_fields(self, manifest: dict) -> None:
+        """Per-field checks; the single source of manifest error strings"""
+        # Check required fields with a single C-level set difference;
+        # sorting keeps the error ordering deterministic.
+        missing = self.REQUIRED_MANIFEST_FIELDS.difference(manifest.keys())
+        for field in sorted(missing):
+            self.errors.append(f"Missing required field in manifest: {field}")
+        for field in sorted(self.REQUIRED_MANIFEST_FIELDS - missing - {'modules'}):
+            # Allow empty modules array, but not empty strings
+            if not manifest[field]:
+                self.errors.append(f"Required field '{field}' cannot be empty")
                 
-    def _validate_modules(self, modules: List[dict], filelist: List[str]) -> None:
-        """Validate module objects"""
-        module_ids = set()
-        
+        # Validate field types: any field that is present must be a
+        # string, so JSON null fails like any other non-string value.
+        for field in self._STR_FIELDS:
+            if field in manifest and not isinstance(manifest[field], str):
+                self.errors.append(f"Field '{field}' must be a string")
+
+    def _validate_modules(self, modules: List[dict], fileset: frozenset) -> None:
+        """Validate module objects (fallback per-field checks)"""
         for idx, module in enumerate(modules):
             if not isinstance(module, dict):
                 self.errors.append(f"Module at index {idx} is not an object")
                 continue
-                
-            # Check required fields
-            for field in self.REQUIRED_MODULE_FIELDS:
-                if field not in module:
-                    self.errors.append(f"Module at index {idx} missing required field: {field}")
-                    
-            # Validate module ID uniqueness
-            if 'id' in module:
-                if not isinstance(module['id'], str):
-                    self.errors.append(f"Module at index {idx}: 'id' must be a string")
-                elif module['id'] in module_ids:
-                    self.errors.append(f"Duplicate module ID: {module['id']}")
+
+            # Archives are usually produced by a single tool, so every
+            # module tends to share one key shape: dispatch to a checker
+            # specialized (and cached) for that exact shape.
+            checker = _make_module_validator(tuple(sorted(module.keys())))
+            checker(module, self.errors, idx)
+
+        self._validate_module_references(modules, fileset)
+
+    def _validate_module_references(self, modules: List[dict], fileset: frozenset) -> None:
+        """
+        Cross-reference checks that a schema cannot express: module IDs must
+        be unique and optional content paths must exist in the archive.
+        """
+        module_ids = set()
+        errs = self.errors.append
+
+        for idx, module in enumerate(modules):
+            if not isinstance(module, dict):
+                continue
+
+            module_id = module.get('id')
+            if isinstance(module_id, str):
+                if module_id in module_ids:
+                    errs(f"Duplicate module ID: {module_id}")
                 else:
-                    module_ids.add(module['id'])
-                    
-            # Validate title
-            if 'title' in module and not isinstance(module['title'], str):
-                self.errors.append(f"Module at index {idx}: 'title' must be a string")
-                
-            # Validate content path exists when provided (optional)
-            if 'content' in module:
-                if not isinstance(module['content'], str):
-                    self.errors.append(f"Module at index {idx}: 'content' must be a string")
-                elif module['content'] not in filelist:
-                    self.errors.append(
-                        f"Module at index {idx}: content file not found: {module['content']}"
-                    )
-                    
-            # Validate order if present
-            if 'order' in module and not isinstance(module['order'], (int, float)):
-                self.errors.append(f"Module at index {idx}: 'order' must be a number")
-
-    def _validate_directories(self, filelist: List[str]) -> None:
+                    module_ids.add(module_id)
+
+            content = module.get('content')
+            if isinstance(content, str) and content not in fileset:
+                errs(f"Module at index {idx}: content file not found: {content}")
+
+    def _validate_directories(self, root_dirs: set) -> None:
         """
         Ensure that only the supported top-level asset directories are present.
-        
+
         Allowed root-level directories:
           - images/
           - videos/
           - files/
-        
+
         Any other directory (e.g. modules/, assets/, etc.) causes validation
         to fail, to discourage embedding pre-rendered structures that should
         instead be described in manifest.json.
         """
-        allowed_root_dirs = {"images", "videos", "files"}
-        found_root_dirs = set()
-
-        for name in filelist:
-            # Normalise ZIP directory entries and nested paths.
-            if "/" in name:
-                root = name.split("/", 1)[0]
-                if root:
-                    found_root_dirs.add(root)
-
-        unexpected = sorted(d for d in found_root_dirs if d not in allowed_root_dirs)
+        unexpected = sorted(root_dirs - _ALLOWED_TOP_DIRS)
         if unexpected:
             self.errors.append(
                 "Unexpected directories in archive: "
@@ -194,7 +418,7 @@ class EdpakValidator:
                 + " (only 'images', 'videos', and 'files' directories are allowed)"
             )
 
-    def _validate_course_structure(self, manifest: Dict[str, Any], filelist: List[str]) -> None:
+    def _validate_course_structure(self, manifest: Dict[str, Any], fileset: frozenset) -> None:
         """
         Perform higher-level validation of course structure for manifests
         that include lessons/files metadata.
@@ -224,32 +448,41 @@ class EdpakValidator:
         if not isinstance(description, str) or not description.strip():
             self.warnings.append("Course description is missing or empty")
 
-        # Build moduleId -> lessons mapping and check lesson objects
-        module_lessons: Dict[str, List[dict]] = defaultdict(list)
+        # Single pass over lessons: partition them by type and by
+        # (moduleId, type) so every later check is a bucket lookup
+        # instead of a re-scan with per-lesson type tests. New lesson
+        # types (Video, Audio, ...) get their own bucket for free.
+        # Bind the append methods once; inside the loops these resolve as
+        # locals (LOAD_FAST) instead of repeated attribute lookups.
+        errs = self.errors.append
+        warns = self.warnings.append
+
+        modules_with_lessons = set()
+        by_type: Dict[str, List[dict]] = {}
+        by_mt: Dict[Tuple[str, str], List[dict]] = {}
         for idx, lesson in enumerate(lessons):
             if not isinstance(lesson, dict):
-                self.errors.append(f"Lesson at index {idx} is not an object")
+                errs(f"Lesson at index {idx} is not an object")
                 continue
 
             module_id = lesson.get('moduleId')
             if not isinstance(module_id, str) or not module_id:
-                self.errors.append(f"Lesson at index {idx} missing valid 'moduleId'")
+                errs(f"Lesson at index {idx} missing valid 'moduleId'")
                 continue
 
-            module_lessons[module_id].append(lesson)
+            modules_with_lessons.add(module_id)
+
+            lesson_type = lesson.get('type')
+            if isinstance(lesson_type, str):
+                # setdefault resolves through a single C-level hash lookup,
+                # avoiding defaultdict's Python-level factory call on misses.
+                by_type.setdefault(lesson_type, []).append(lesson)
+                by_mt.setdefault((module_id, lesson_type), []).append(lesson)
 
         # Course cover image: at least one image lesson with a valid filePath
-        course_cover_found = False
-        for lesson in lessons:
-            if not isinstance(lesson, dict):
-                continue
-            if lesson.get('type') == 'Image':
-                fp = lesson.get('filePath')
-                if isinstance(fp, str) and fp and fp in filelist:
-                    course_cover_found = True
-                    break
+        course_cover_found = _has_valid_image(by_type.get('Image', ()), fileset)
         if not course_cover_found:
-            self.warnings.append(
+            warns(
                 "Course cover image not found (no image lessons with valid filePath)"
             )
 
@@ -257,98 +490,279 @@ class EdpakValidator:
         # and an image lesson we can treat as a module cover.
         for idx, module in enumerate(modules):
             if not isinstance(module, dict):
-                self.errors.append(f"Module at index {idx} is not an object")
+                errs(f"Module at index {idx} is not an object")
                 continue
 
             module_id = module.get('id')
             title = module.get('title')
 
             if 'title' in module and (not isinstance(title, str) or not title.strip()):
-                self.errors.append(
+                errs(
                     f"Module at index {idx} has an empty or invalid 'title'"
                 )
 
             # Module description is strongly recommended but not strictly required.
             m_desc = module.get('description')
             if not isinstance(m_desc, str) or not m_desc.strip():
-                self.warnings.append(
+                warns(
                     f"Module '{module_id}' is missing a description"
                 )
 
-            lessons_for_module = module_lessons.get(module_id, [])
-            if not lessons_for_module:
-                self.errors.append(
+            if module_id not in modules_with_lessons:
+                errs(
                     f"Module '{module_id}' ('{title}') has no lessons associated with it"
                 )
                 continue
 
-            quiz_count = sum(
-                1
-                for lesson in lessons_for_module
-                if lesson.get('type') == 'MultipleChoice'
-            )
-            if quiz_count == 0:
-                self.warnings.append(
+            if not by_mt.get((module_id, 'MultipleChoice')):
+                warns(
                     f"Module '{module_id}' ('{title}') has no quiz lessons of type 'MultipleChoice'"
                 )
 
-            module_cover_found = any(
-                lesson.get('type') == 'Image'
-                and isinstance(lesson.get('filePath'), str)
-                and lesson['filePath'] in filelist
-                for lesson in lessons_for_module
+            module_cover_found = _has_valid_image(
+                by_mt.get((module_id, 'Image'), ()), fileset
             )
             if not module_cover_found:
-                self.warnings.append(
+                warns(
                     f"Module '{module_id}' ('{title}') has no image lessons with valid filePath (module cover image missing)"
                 )
 
 
-def verify_edpak(filepath: str) -> Tuple[bool, List[str], List[str]]:
+@functools.lru_cache(maxsize=64)
+def _make_module_validator(keys: Tuple[str, ...]):
+    """
+    Code-generate a module checker specialized for one exact key shape.
+
+    Only field names from the validator's own static tables ever appear in
+    the generated source; manifest-supplied keys merely form the cache key.
+    Archives written by a single producer share one shape, so after the
+    first module every subsequent one runs straight-line generated code
+    with no per-field dict probing.
+    """
+    key_set = frozenset(keys)
+    lines = ["def _module_check(module, errors, idx):"]
+
+    for field in sorted(EdpakValidator.REQUIRED_MODULE_FIELDS - key_set):
+        lines.append(
+            f"    errors.append(f\"Module at index {{idx}} missing required field: {field}\")"
+        )
+
+    for field in EdpakValidator._MODULE_STR_FIELDS:
+        if field in key_set:
+            # Presence-based: a field that is present must be a string,
+            # so JSON null is rejected like any other non-string value.
+            lines.append(f"    if not isinstance(module[{field!r}], str):")
+            lines.append(
+                f"        errors.append(f\"Module at index {{idx}}: '{field}' must be a string\")"
+            )
+
+    if 'order' in key_set:
+        lines.append("    if not isinstance(module['order'], (int, float)):")
+        lines.append(
+            "        errors.append(f\"Module at index {idx}: 'order' must be a number\")"
+        )
+
+    lines.append("    return None")
+
+    namespace: Dict[str, Any] = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['_module_check']
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_cached(abspath: str, mtime_ns: int, size: int) -> ValidationResult:
+    """Run the real validation; mtime_ns/size only serve as cache keys."""
+    validator = EdpakValidator(abspath)
+    return validator.validate()
+
+
+def verify_edpak(filepath: str) -> ValidationResult:
     """
     Verify if an edpak file is compliant with the edpak standard.
-    
+
+    Results are memoized on (absolute path, mtime, size), so repeated
+    validation of an unchanged file (bulk CLI runs, CI pipelines)
+    collapses to a stat() call.
+
     Args:
         filepath: Path to the .edpak file
-        
+
     Returns:
-        Tuple of (is_valid, errors, warnings)
+        ValidationResult of (is_valid, errors, warnings)
     """
-    validator = EdpakValidator(filepath)
-    return validator.validate()
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        # Missing/unreadable path: answer from the failed stat alone,
+        # without building a validator that would only re-discover the
+        # same condition (open -> ENOENT -> exception unwinding).
+        return ValidationResult(False, [f"File not found: {filepath}"], [])
 
+    is_valid, errors, warnings = _validate_cached(
+        os.path.abspath(filepath), st.st_mtime_ns, st.st_size
+    )
+    # Hand out copies so callers cannot mutate the cached lists.
+    return ValidationResult(is_valid, list(errors), list(warnings))
+
+
+def clear_validation_cache() -> None:
+    """Reset the memoized verify_edpak results (tests, long-running callers)."""
+    _validate_cached.cache_clear()
+
+
+def verify_edpak_stream(fileobj) -> ValidationResult:
+    """
+    Verify an edpak archive supplied as a binary file-like object.
+
+    Validates the archive contents directly (skipping the path-based
+    extension and existence checks), so in-memory archives such as a
+    BytesIO never need to touch the filesystem.
+
+    Args:
+        fileobj: Seekable binary file-like object holding the archive
+
+    Returns:
+        ValidationResult of (is_valid, errors, warnings)
+    """
+    validator = EdpakValidator('<stream>')
+    try:
+        with zipfile.ZipFile(fileobj, 'r') as zf:
+            validator._validate_zip_contents(zf)
+    except zipfile.BadZipFile:
+        validator.errors.append("File is not a valid ZIP archive")
+    except Exception as e:
+        validator.errors.append(f"Error reading ZIP file: {str(e)}")
+    return ValidationResult(
+        len(validator.errors) == 0, validator.errors, validator.warnings
+    )
+
+
+def verify_edpak_many(filepaths: List[str]) -> List[ValidationResult]:
+    """
+    Validate several edpak files sequentially in this process.
+
+    The fixed per-call costs (regex compilation, the compiled manifest
+    schema, the allowed-directory set) are all paid once at module import,
+    so this loop is pure validation work, and unchanged files additionally
+    hit the stat-keyed result cache. For large batches on multi-core
+    machines, verify_many spreads the same work over a process pool.
+
+    Args:
+        filepaths: Paths to the .edpak files
+
+    Returns:
+        List of ValidationResult tuples, in input order
+    """
+    return [verify_edpak(fp) for fp in filepaths]
+
+
+def verify_many(filepaths: List[str],
+                max_workers: Optional[int] = None) -> List[ValidationResult]:
+    """
+    Validate several edpak files in parallel.
+
+    Each validation is independent (no shared state), so the work is
+    farmed out to a process pool and scales nearly linearly with cores
+    on directories of many edpak files.
+
+    Args:
+        filepaths: Paths to the .edpak files
+        max_workers: Pool size; defaults to the number of CPUs
+
+    Returns:
+        List of ValidationResult tuples, in input order
+    """
+    if len(filepaths) < 2:
+        # Not worth spawning a pool for a single file.
+        return verify_edpak_many(filepaths)
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(verify_edpak, filepaths, chunksize=16))
+
+
+async def verify_edpak_async(filepath: str) -> ValidationResult:
+    """
+    Asynchronously validate a single edpak file.
+
+    The blocking zip/central-directory reads run in the event loop's
+    thread pool, so callers can overlap I/O on many files while parsed
+    manifests are validated.
+
+    Args:
+        filepath: Path to the .edpak file
+
+    Returns:
+        ValidationResult of (is_valid, errors, warnings)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, verify_edpak, filepath)
+
+
+async def verify_many_async(filepaths: List[str],
+                            queue_depth: int = 64) -> List[ValidationResult]:
+    """
+    Asynchronously validate several edpak files with bounded concurrency.
+
+    Args:
+        filepaths: Paths to the .edpak files
+        queue_depth: Maximum number of files validated concurrently
+
+    Returns:
+        List of ValidationResult tuples, in input order
+    """
+    semaphore = asyncio.Semaphore(queue_depth)
+
+    async def bounded(filepath: str) -> ValidationResult:
+        async with semaphore:
+            return await verify_edpak_async(filepath)
+
+    return list(await asyncio.gather(*(bounded(fp) for fp in filepaths)))
+
+
+def _format_result(filepath: str, is_valid: bool, errors: List[str], warnings: List[str]) -> List[str]:
+    """Build the report lines for a single file"""
+    out = [f"\nValidating: {filepath}\n", "=" * 60 + "\n"]
 
-def main():
-    """Command-line interface for edpak verification"""
-    if len(sys.argv) != 2:
-        print("Usage: edpak-verify <file.edpak>")
-        print("\nVerifies if an edpak file is compliant with the edpak standard")
-        sys.exit(1)
-        
-    filepath = sys.argv[1]
-    is_valid, errors, warnings = verify_edpak(filepath)
-    
-    print(f"\nValidating: {filepath}")
-    print("=" * 60)
-    
     if warnings:
-        print("\nWarnings:")
+        out.append("\nWarnings:\n")
         for warning in warnings:
-            print(f"  ⚠  {warning}")
-            
+            out.append(f"  ⚠  {warning}\n")
+
     if errors:
-        print("\nErrors:")
+        out.append("\nErrors:\n")
         for error in errors:
-            print(f"  ✗ {error}")
-            
-    print("\n" + "=" * 60)
+            out.append(f"  ✗ {error}\n")
+
+    out.append("\n" + "=" * 60 + "\n")
     if is_valid:
-        print("✓ Valid edpak file!")
-        sys.exit(0)
+        out.append("✓ Valid edpak file!\n")
     else:
-        print("✗ Invalid edpak file")
+        out.append("✗ Invalid edpak file\n")
+    return out
+
+
+def main() -> None:
+    """Command-line interface for edpak verification"""
+    if len(sys.argv) < 2:
+        print("Usage: edpak-verify <file.edpak> [<file.edpak> ...]")
+        print("\nVerifies if edpak files are compliant with the edpak standard")
         sys.exit(1)
 
+    filepaths = sys.argv[1:]
+    results = verify_many(filepaths)
+
+    # Accumulate the whole report and flush it in one write, instead of
+    # a stdio lock acquisition and flush per print call.
+    out: List[str] = []
+    exit_code = 0
+    for filepath, (is_valid, errors, warnings) in zip(filepaths, results):
+        out.extend(_format_result(filepath, is_valid, errors, warnings))
+        if not is_valid:
+            exit_code = 1
+
+    sys.stdout.write(''.join(out))
+    sys.exit(exit_code)
+
 
 if __name__ == '__main__':
     main()
@@ -1,8 +1,19 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional ahead-of-time compilation: EDPAK_MYPYC=1 pip install . builds the
+# validator with mypyc, turning the annotated module/lesson loops into C-level
+# code. The default install stays pure Python with no build dependencies.
+ext_modules = []
+if os.environ.get("EDPAK_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["edpak_validator.py"])
+
 setup(
     name="edpak-validator",
     version="1.0.0",
@@ -12,6 +23,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/pierce403/edpak",
     py_modules=["edpak_validator"],
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -3,43 +3,158 @@
 Tests for edpak validator
 """
 
+import hashlib
+import io
 import json
 import os
 import tempfile
 import unittest
 import zipfile
-from pathlib import Path
 
-from edpak_validator import verify_edpak, EdpakValidator
+from edpak_validator import verify_edpak, verify_edpak_stream
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - optional speedup
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+
+# Shared manifest building blocks. Tests merge these into fresh dicts
+# ({**_BASE_MANIFEST, ...} / dict(_MODULE_1)) instead of rebuilding the
+# same skeleton literal per test; the templates themselves are never
+# mutated.
+_BASE_MANIFEST = {
+    "title": "Test Course",
+    "version": "1.0.0",
+    "author": "Test Author",
+}
+
+_MODULE_1 = {
+    "id": "module-1",
+    "title": "Module 1",
+    "content": "module1.html",
+}
+
+# Pre-encoded content payloads shared across tests; writestr takes its
+# bytes fast path with these, skipping a per-call str.encode('utf-8').
+_HTML_M1 = b"<h1>Module 1</h1>"
+_HTML_M2 = b"<h1>Module 2</h1>"
+_IMG1 = b"img1-bytes"
+_IMG2 = b"img2-bytes"
+_IMG = b"img-bytes"
+_VIDEO = b"video-bytes"
+_PDF = b"pdf-bytes"
+
+# Quiz lesson content payloads, serialized once at import time instead
+# of per test run.
+_QUIZ_Q1 = _dumps({"Question": "Q1", "Options": [{"Text": "A", "IsCorrect": True}]}).decode()
+_QUIZ_Q2 = _dumps({"Question": "Q2", "Options": [{"Text": "A", "IsCorrect": True}]}).decode()
+
+
+def _zipinfo(path):
+    """Build a ZipInfo with a fixed timestamp and preset compression.
+
+    Passing a ready ZipInfo to writestr skips the per-entry ZipInfo
+    synthesis and the time.localtime() call for each write. All test
+    filenames are plain ASCII str, so the UTF-8 flag (bit 11) stays
+    clear and the filename encoding takes its cheap bytes path.
+    """
+    zi = zipfile.ZipInfo(filename=path, date_time=(1980, 1, 1, 0, 0, 0))
+    zi.compress_type = zipfile.ZIP_STORED
+    zi.flag_bits = 0
+    return zi
 
 
 class TestEdpakValidator(unittest.TestCase):
     """Test cases for the edpak validator"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the whole class"""
+        # One tmpdir for the suite: every test writes a uniquely named
+        # file, so sharing the directory avoids per-test mkdir/rmtree
+        # churn without any risk of collisions.
+        cls.temp_dir = tempfile.mkdtemp()
+        # Precomputed "<tempdir>/" prefix: plain string concatenation is
+        # cheaper than os.path.join's separator/type handling, and every
+        # test path is a bare filename under this one directory.
+        cls._tmp_prefix = cls.temp_dir + os.sep
+        cls._verify_cache = {}
+
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test files"""
         import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
-    def create_edpak_file(self, filename, manifest, content_files=None):
-        """Helper to create an edpak file for testing"""
-        filepath = os.path.join(self.temp_dir, filename)
-        
-        with zipfile.ZipFile(filepath, 'w') as zf:
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def create_edpak_bytes(self, manifest, content_files=None):
+        """Helper to build an edpak archive in memory"""
+        buf = io.BytesIO()
+
+        # ZIP_STORED skips deflate entirely and allowZip64=False trims the
+        # zip64 end-record bookkeeping — these tiny payloads need neither.
+        # strict_timestamps=False also drops the per-entry timestamp range
+        # check (our fixed 1980 date never needs clamping anyway).
+        with zipfile.ZipFile(buf, 'w', compression=zipfile.ZIP_STORED,
+                             allowZip64=False, strict_timestamps=False) as zf:
             # Add manifest
-            zf.writestr('manifest.json', json.dumps(manifest))
-            
+            zf.writestr(_zipinfo('manifest.json'), _dumps(manifest))
+
             # Add content files if provided
             if content_files:
                 for path, content in content_files.items():
-                    zf.writestr(path, content)
-                    
+                    zf.writestr(_zipinfo(path), content)
+
+        buf.seek(0)
+        return buf
+
+    def create_edpak_file(self, filename, manifest, content_files=None):
+        """Helper to create an edpak file on disk for testing"""
+        filepath = self._tmp_prefix + filename
+        buf = self.create_edpak_bytes(manifest, content_files)
+        with open(filepath, 'wb') as f:
+            f.write(buf.getvalue())
         return filepath
-    
+
+    def _verify(self, filename, manifest, content_files=None, on_disk=False):
+        """
+        Build an edpak payload and validate it, memoizing on the payload.
+
+        Regular .edpak payloads are built in a BytesIO and validated via
+        the stream API, never touching the filesystem; on_disk=True (and
+        any non-.edpak filename) goes through create_edpak_file +
+        verify_edpak so the path-based pipeline — extension handling, the
+        small-archive preload, and the stat-keyed result cache — keeps
+        coverage too. Identical payloads across tests reuse the cached
+        result instead of rebuilding and revalidating the zip.
+        """
+        key = (
+            filename,
+            on_disk,
+            hashlib.blake2b(_dumps(manifest)).digest(),
+            tuple(sorted((content_files or {}).items())),
+        )
+        cached = self._verify_cache.get(key)
+        if cached is None:
+            if filename.endswith('.edpak') and not on_disk:
+                cached = verify_edpak_stream(
+                    self.create_edpak_bytes(manifest, content_files)
+                )
+            else:
+                filepath = self.create_edpak_file(filename, manifest, content_files)
+                cached = verify_edpak(filepath)
+            self._verify_cache[key] = cached
+        return cached
+
+    def _has_warning(self, warnings, needle):
+        """Case-insensitive substring search over the joined warnings.
+
+        One join+lower instead of re-lowering every warning per assertion.
+        """
+        return needle.lower() in "\n".join(warnings).lower()
+
     def test_course_structure_with_lessons_and_quizzes(self):
         """Course with lessons, quizzes, and covers should be valid"""
         manifest = {
@@ -82,10 +197,7 @@ class TestEdpakValidator(unittest.TestCase):
                     "status": "Active",
                     "order": 2,
                     "description": "",
-                    "content": json.dumps({
-                        "Question": "Q1",
-                        "Options": [{"Text": "A", "IsCorrect": True}]
-                    }),
+                    "content": _QUIZ_Q1,
                     "fileId": None,
                     "filePath": None
                 },
@@ -109,31 +221,27 @@ class TestEdpakValidator(unittest.TestCase):
                     "status": "Active",
                     "order": 2,
                     "description": "",
-                    "content": json.dumps({
-                        "Question": "Q2",
-                        "Options": [{"Text": "A", "IsCorrect": True}]
-                    }),
+                    "content": _QUIZ_Q2,
                     "fileId": None,
                     "filePath": None
                 }
             ]
         }
         content_files = {
-            "module-1.html": "<h1>Module 1</h1>",
-            "module-2.html": "<h1>Module 2</h1>",
-            "images/img1.png": "img1-bytes",
-            "images/img2.png": "img2-bytes"
+            "module-1.html": _HTML_M1,
+            "module-2.html": _HTML_M2,
+            "images/img1.png": _IMG1,
+            "images/img2.png": _IMG2
         }
         
-        filepath = self.create_edpak_file("structured.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("structured.edpak", manifest, content_files)
         
         self.assertTrue(is_valid)
         self.assertEqual(len(errors), 0)
         # No structural course warnings expected in the happy path
-        self.assertFalse(any("no lessons associated" in w.lower() for w in warnings))
-        self.assertFalse(any("no quiz lessons" in w.lower() for w in warnings))
-        self.assertFalse(any("cover image not found" in w.lower() for w in warnings))
+        self.assertFalse(self._has_warning(warnings, "no lessons associated"))
+        self.assertFalse(self._has_warning(warnings, "no quiz lessons"))
+        self.assertFalse(self._has_warning(warnings, "cover image not found"))
     
     def test_course_structure_missing_metadata_and_quizzes(self):
         """Missing description and quizzes should trigger warnings but not errors"""
@@ -164,69 +272,118 @@ class TestEdpakValidator(unittest.TestCase):
             ]
         }
         content_files = {
-            "module-1.html": "<h1>Module 1</h1>",
-            "images/img1.png": "img1-bytes"
+            "module-1.html": _HTML_M1,
+            "images/img1.png": _IMG1
         }
         
-        filepath = self.create_edpak_file("missing-metadata.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("missing-metadata.edpak", manifest, content_files)
         
         # Structural checks should still consider this a valid edpak,
         # but emit warnings about missing metadata and quizzes.
         self.assertTrue(is_valid)
         self.assertEqual(len(errors), 0)
-        self.assertTrue(any("course description is missing" in w.lower() for w in warnings))
-        self.assertTrue(any("module 'module-1' is missing a description" in w.lower() for w in warnings))
-        self.assertTrue(any("no quiz lessons" in w.lower() for w in warnings))
-        
-    def test_valid_edpak_file(self):
-        """Test validation of a valid edpak file"""
-        manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "modules": [
+        self.assertTrue(self._has_warning(warnings, "course description is missing"))
+        self.assertTrue(self._has_warning(warnings, "module 'module-1' is missing a description"))
+        self.assertTrue(self._has_warning(warnings, "no quiz lessons"))
+        
+    def test_happy_path_variants(self):
+        """Valid manifests in several shapes should all pass cleanly"""
+        cases = [
+            # (name, manifest, content_files, on_disk); the first case is
+            # written to disk and validated via verify_edpak so the
+            # path-based pipeline keeps a happy-path test, the rest stay
+            # in memory.
+            (
+                "valid.edpak",
+                {**_BASE_MANIFEST, "modules": [dict(_MODULE_1)]},
+                {"module1.html": _HTML_M1},
+                True,
+            ),
+            (
+                "with-order.edpak",
+                {**_BASE_MANIFEST, "modules": [{**_MODULE_1, "order": 1}]},
+                {"module1.html": _HTML_M1},
+                False,
+            ),
+            (
+                "with-optional.edpak",
                 {
-                    "id": "module-1",
-                    "title": "Module 1",
-                    "content": "module1.html"
-                }
-            ]
-        }
-        content_files = {
-            "module1.html": "<h1>Module 1</h1>"
+                    **_BASE_MANIFEST,
+                    "description": "A test course",
+                    "language": "en",
+                    "modules": [dict(_MODULE_1)],
+                },
+                {"module1.html": _HTML_M1},
+                False,
+            ),
+            (
+                "allowed-dirs.edpak",
+                {**_BASE_MANIFEST, "modules": []},
+                {
+                    "images/img1.png": _IMG,
+                    "videos/vid1.mp4": _VIDEO,
+                    "files/doc1.pdf": _PDF,
+                },
+                False,
+            ),
+        ]
+        for name, manifest, content_files, on_disk in cases:
+            with self.subTest(name=name):
+                is_valid, errors, warnings = self._verify(
+                    name, manifest, content_files, on_disk=on_disk
+                )
+                self.assertTrue(is_valid)
+                self.assertEqual(len(errors), 0)
+
+    def test_malformed_archives(self):
+        """Broken archives should each fail with the expected error"""
+        def _no_manifest(path):
+            with zipfile.ZipFile(path, 'w', strict_timestamps=False) as zf:
+                zf.writestr(_zipinfo('readme.txt'), b"No manifest here")
+
+        def _bad_json(path):
+            with zipfile.ZipFile(path, 'w', strict_timestamps=False) as zf:
+                zf.writestr(_zipinfo('manifest.json'), b"{invalid json")
+
+        def _not_a_zip(path):
+            with open(path, 'wb') as f:
+                f.write(b"This is not a ZIP file")
+
+        # (filename, builder, expected error substring); the builder runs
+        # lazily inside the subTest, so each broken file is only written
+        # when its case executes.
+        cases = [
+            ("no-manifest.edpak", _no_manifest, "manifest.json"),
+            ("invalid-json.edpak", _bad_json, "Invalid JSON"),
+            ("notzip.edpak", _not_a_zip, "not a valid ZIP"),
+        ]
+        for filename, build, expected in cases:
+            with self.subTest(name=filename):
+                filepath = self._tmp_prefix + filename
+                build(filepath)
+                is_valid, errors, warnings = verify_edpak(filepath)
+
+                self.assertFalse(is_valid)
+                self.assertTrue(any(expected in e for e in errors))
+
+    def test_streamed_manifest_keeps_float_order(self):
+        """Manifests past the streaming threshold keep numeric types"""
+        manifest = {
+            **_BASE_MANIFEST,
+            # Padding pushes manifest.json over the 1 MiB streaming
+            # threshold, so the ijson branch (when installed) must
+            # round-trip the float 'order' as a number, not a Decimal.
+            "description": "x" * (1024 * 1024 + 1024),
+            "modules": [{**_MODULE_1, "order": 1.5}],
         }
-        
-        filepath = self.create_edpak_file("valid.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
-        
+
+        is_valid, errors, warnings = self._verify(
+            "streamed-float-order.edpak", manifest, {"module1.html": _HTML_M1}
+        )
+
         self.assertTrue(is_valid)
         self.assertEqual(len(errors), 0)
-        
-    def test_missing_manifest(self):
-        """Test validation fails when manifest.json is missing"""
-        filepath = os.path.join(self.temp_dir, "no-manifest.edpak")
-        
-        with zipfile.ZipFile(filepath, 'w') as zf:
-            zf.writestr('readme.txt', "No manifest here")
-            
-        is_valid, errors, warnings = verify_edpak(filepath)
-        
-        self.assertFalse(is_valid)
-        self.assertTrue(any("manifest.json" in e for e in errors))
-        
-    def test_invalid_json_manifest(self):
-        """Test validation fails with invalid JSON in manifest"""
-        filepath = os.path.join(self.temp_dir, "invalid-json.edpak")
-        
-        with zipfile.ZipFile(filepath, 'w') as zf:
-            zf.writestr('manifest.json', "{invalid json")
-            
-        is_valid, errors, warnings = verify_edpak(filepath)
-        
-        self.assertFalse(is_valid)
-        self.assertTrue(any("Invalid JSON" in e for e in errors))
-        
+
     def test_missing_required_fields(self):
         """Test validation fails when required fields are missing"""
         manifest = {
@@ -234,8 +391,7 @@ class TestEdpakValidator(unittest.TestCase):
             # Missing version, author, modules
         }
         
-        filepath = self.create_edpak_file("missing-fields.edpak", manifest)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("missing-fields.edpak", manifest)
         
         self.assertFalse(is_valid)
         self.assertTrue(any("version" in e for e in errors))
@@ -245,29 +401,18 @@ class TestEdpakValidator(unittest.TestCase):
     def test_duplicate_module_ids(self):
         """Test validation fails with duplicate module IDs"""
         manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
+            **_BASE_MANIFEST,
             "modules": [
-                {
-                    "id": "module-1",
-                    "title": "Module 1",
-                    "content": "module1.html"
-                },
-                {
-                    "id": "module-1",
-                    "title": "Module 2",
-                    "content": "module2.html"
-                }
+                dict(_MODULE_1),
+                {**_MODULE_1, "title": "Module 2", "content": "module2.html"}
             ]
         }
         content_files = {
-            "module1.html": "<h1>Module 1</h1>",
-            "module2.html": "<h1>Module 2</h1>"
+            "module1.html": _HTML_M1,
+            "module2.html": _HTML_M2
         }
         
-        filepath = self.create_edpak_file("duplicate-ids.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("duplicate-ids.edpak", manifest, content_files)
         
         self.assertFalse(is_valid)
         self.assertTrue(any("Duplicate module ID" in e for e in errors))
@@ -275,20 +420,11 @@ class TestEdpakValidator(unittest.TestCase):
     def test_missing_content_file(self):
         """Test validation fails when referenced content file is missing"""
         manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "modules": [
-                {
-                    "id": "module-1",
-                    "title": "Module 1",
-                    "content": "missing.html"
-                }
-            ]
+            **_BASE_MANIFEST,
+            "modules": [{**_MODULE_1, "content": "missing.html"}]
         }
         
-        filepath = self.create_edpak_file("missing-content.edpak", manifest)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("missing-content.edpak", manifest)
         
         self.assertFalse(is_valid)
         self.assertTrue(any("content file not found" in e for e in errors))
@@ -296,76 +432,31 @@ class TestEdpakValidator(unittest.TestCase):
     def test_unexpected_directories_fail_validation(self):
         """Test validation fails when unexpected directories are present"""
         manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "modules": [
-                {
-                    "id": "module-1",
-                    "title": "Module 1"
-                }
-            ]
+            **_BASE_MANIFEST,
+            "modules": [{"id": "module-1", "title": "Module 1"}]
         }
         # Include content under a disallowed directory such as 'modules/'
         content_files = {
-            "modules/module-1.html": "<h1>Module 1</h1>"
+            "modules/module-1.html": _HTML_M1
         }
 
-        filepath = self.create_edpak_file("unexpected-dirs.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("unexpected-dirs.edpak", manifest, content_files)
 
         self.assertFalse(is_valid)
         self.assertTrue(any("Unexpected directories in archive" in e for e in errors))
         
     def test_wrong_file_extension(self):
         """Test validation warns about wrong file extension"""
-        manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "modules": []
-        }
+        manifest = {**_BASE_MANIFEST, "modules": []}
         
-        filepath = self.create_edpak_file("test.zip", manifest)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("test.zip", manifest)
         
         self.assertFalse(is_valid)
         self.assertTrue(any(".edpak extension" in e for e in errors))
         
-    def test_allowed_directories_are_accepted(self):
-        """Test images/videos/files directories are allowed"""
-        manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "modules": []
-        }
-        content_files = {
-            "images/img1.png": "img-bytes",
-            "videos/vid1.mp4": "video-bytes",
-            "files/doc1.pdf": "pdf-bytes"
-        }
-        
-        filepath = self.create_edpak_file("allowed-dirs.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
-        
-        self.assertTrue(is_valid)
-        self.assertEqual(len(errors), 0)
-        
-    def test_not_a_zip_file(self):
-        """Test validation fails for non-ZIP files"""
-        filepath = os.path.join(self.temp_dir, "notzip.edpak")
-        with open(filepath, 'w') as f:
-            f.write("This is not a ZIP file")
-            
-        is_valid, errors, warnings = verify_edpak(filepath)
-        
-        self.assertFalse(is_valid)
-        self.assertTrue(any("not a valid ZIP" in e for e in errors))
-        
     def test_nonexistent_file(self):
         """Test validation fails for non-existent files"""
-        filepath = os.path.join(self.temp_dir, "does-not-exist.edpak")
+        filepath = self._tmp_prefix + "does-not-exist.edpak"
         is_valid, errors, warnings = verify_edpak(filepath)
         
         self.assertFalse(is_valid)
@@ -373,81 +464,22 @@ class TestEdpakValidator(unittest.TestCase):
         
     def test_empty_modules_array(self):
         """Test validation warns about empty modules array"""
-        manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "modules": []
-        }
+        manifest = {**_BASE_MANIFEST, "modules": []}
         
-        filepath = self.create_edpak_file("empty-modules.edpak", manifest)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("empty-modules.edpak", manifest)
         
         self.assertTrue(is_valid)
         self.assertTrue(any("No modules defined" in w for w in warnings))
         
-    def test_module_with_order(self):
-        """Test validation accepts modules with order field"""
-        manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "modules": [
-                {
-                    "id": "module-1",
-                    "title": "Module 1",
-                    "content": "module1.html",
-                    "order": 1
-                }
-            ]
-        }
-        content_files = {
-            "module1.html": "<h1>Module 1</h1>"
-        }
-        
-        filepath = self.create_edpak_file("with-order.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
-        
-        self.assertTrue(is_valid)
-        self.assertEqual(len(errors), 0)
-        
-    def test_manifest_with_optional_fields(self):
-        """Test validation accepts optional fields"""
-        manifest = {
-            "title": "Test Course",
-            "version": "1.0.0",
-            "author": "Test Author",
-            "description": "A test course",
-            "language": "en",
-            "modules": [
-                {
-                    "id": "module-1",
-                    "title": "Module 1",
-                    "content": "module1.html"
-                }
-            ]
-        }
-        content_files = {
-            "module1.html": "<h1>Module 1</h1>"
-        }
-        
-        filepath = self.create_edpak_file("with-optional.edpak", manifest, content_files)
-        is_valid, errors, warnings = verify_edpak(filepath)
-        
-        self.assertTrue(is_valid)
-        self.assertEqual(len(errors), 0)
-        
     def test_invalid_field_types(self):
         """Test validation fails with invalid field types"""
         manifest = {
+            **_BASE_MANIFEST,
             "title": 123,  # Should be string
-            "version": "1.0.0",
-            "author": "Test Author",
             "modules": "not an array"  # Should be array
         }
         
-        filepath = self.create_edpak_file("invalid-types.edpak", manifest)
-        is_valid, errors, warnings = verify_edpak(filepath)
+        is_valid, errors, warnings = self._verify("invalid-types.edpak", manifest)
         
         self.assertFalse(is_valid)
         self.assertTrue(any("'title' must be a string" in e for e in errors))